@@ -0,0 +1,37 @@
+from bisect import bisect_right
+
+
+class LaneHazard:
+    """Class to manage the hazard state of a whole lane.
+
+    The phases are stored as timed arrays and evaluated once per frame,
+    so every entity in the lane shares the same state.
+    """
+
+    def __init__(self, phases, start):
+        """Build the phase arrays from (name, duration, rideable, deadly)."""
+        self.names = []
+        self.ends = []
+        self.rideables = []
+        self.deadlies = []
+        end = 0
+        for name, duration, rideable, deadly in phases:
+            end += duration
+            self.names.append(name)
+            self.ends.append(end)
+            self.rideables.append(rideable)
+            self.deadlies.append(deadly)
+        self.cycle = end
+        self.start = start
+
+        # current state
+        self.phase = self.names[0]
+        self.rideable = self.rideables[0]
+        self.deadly = self.deadlies[0]
+
+    def update(self, now):
+        """Find the current phase of the lane."""
+        index = bisect_right(self.ends, (now - self.start) % self.cycle)
+        self.phase = self.names[index]
+        self.rideable = self.rideables[index]
+        self.deadly = self.deadlies[index]
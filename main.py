@@ -3,7 +3,9 @@ import sys
 from os import path
 
 from settings import *
+from hazards import *
 from sprites import *
+from stats import *
 from tilemap import *
 
 
@@ -29,6 +31,9 @@ class Game:
         # load spritesheet image
         self.spritesheet = Spritesheet(path.join(img_folder, SPRITESHEET))
 
+        # open high-score and session-stats store
+        self.stats = StatsStore(path.join(game_folder, STATS_DB))
+
     def new(self):
         """Initialize all variables and do all the setup for a new game."""
         self.map = TiledMap(path.join(self.map_folder, 'frogger_map.tmx'))
@@ -40,6 +45,13 @@ class Game:
         self.homes = pygame.sprite.Group()
         self.cars = pygame.sprite.Group()
         self.platforms = pygame.sprite.Group()
+        self.alligators = pygame.sprite.Group()
+
+        # hazard state for each lane (diving turtles, alligator jaws)
+        now = pygame.time.get_ticks()
+        self.hazards = {}
+        for lane, phases in HAZARD_PHASES.items():
+            self.hazards[lane] = LaneHazard(phases, now)
 
         # place homes and players
         for x in HOME_LOCATIONS:
@@ -51,6 +63,11 @@ class Game:
         self.create_platforms()
         self.player = Player(self)
 
+        # start tracking stats for this session
+        self.score = 0
+        self.home_start = pygame.time.get_ticks()
+        self.stats.start_session()
+
     def run(self):
         """Game Loop **set self.playing = False to end the game**"""
         self.playing = True
@@ -59,14 +76,21 @@ class Game:
             self.events()
             self.update()
             self.draw()
+        self.stats.end_session(self.score, self.player.hops)
 
     def update(self):
         """Game Loop - Update"""
+        now = pygame.time.get_ticks()
+        for hazard in self.hazards.values():
+            hazard.update(now)
         self.all_sprites.update()
 
         # frog reaches home
         arrivals = pygame.sprite.spritecollide(self.player, self.homes, True)
         for arrival in arrivals:
+            self.stats.log_event('home', value=(now - self.home_start) / 1000)
+            self.home_start = now
+            self.score += HOME_SCORE
             self.player.reset_pos()
             self.map_img.blit(
                 self.player.down_frames[0], (arrival.rect.centerx - 26, 
@@ -74,21 +98,34 @@ class Game:
 
         # frogger hits bush
         if self.player.in_bushes() and not arrivals:
+            self.stats.log_event('death', 'bush')
             self.player.reset_pos()
             self.player.lives -= 1
 
         # frogger hits car
         if pygame.sprite.spritecollideany(self.player, self.cars):
+            self.stats.log_event('death', 'car')
             self.player.reset_pos()
             self.player.lives -= 1
         
-        # frogger rides platform
-        rides = pygame.sprite.spritecollide(self.player, self.platforms, False)
+        # frogger rides platform (not turtles that are under water)
+        rides = [ride for ride in pygame.sprite.spritecollide(
+                    self.player, self.platforms, False)
+                 if self.lane_rideable(ride.lane)]
         for ride in rides:
             self.player.x += ride.speed / len(rides)
         
+        # frogger lands in the open jaws of an alligator
+        gator = pygame.sprite.spritecollideany(self.player, self.alligators)
+        if gator and self.hazards[gator.lane].deadly and \
+                self.player.rect.colliderect(gator.head_rect()):
+            self.stats.log_event('death', 'alligator')
+            self.player.reset_pos()
+            self.player.lives -= 1
+
         # frogger in water
         if self.player.in_water() and not rides:
+            self.stats.log_event('death', 'water')
             self.player.reset_pos()
             self.player.lives -= 1
 
@@ -165,7 +202,10 @@ class Game:
     
     def create_platform(self, platform_num, lane):
         """Create a single car and place in lane."""
-        platform = Platform(self, lane)
+        if lane in ALLIGATOR_LANES and platform_num < ALLIGATORS_PER_LANE[lane]:
+            platform = Alligator(self, lane)
+        else:
+            platform = Platform(self, lane)
         platform_width = platform.rect.width
 
         # set spacing of platforms
@@ -175,6 +215,12 @@ class Game:
             platform.x = WIDTH + ((WIDTH / PLATFORMS_PER_LANE[lane]) * platform_num)
         platform.rect.x = platform.x
 
+    def lane_rideable(self, lane):
+        """Check if a lane's platforms can be ridden right now."""
+        if lane in self.hazards:
+            return self.hazards[lane].rideable
+        return True
+
     def draw_text(self, text, font_name, size, color, x, y, align="nw"):
         """Function to draw text to the screen."""
         font = pygame.font.Font(font_name, size)
@@ -223,6 +269,11 @@ class Game:
                        int(WIDTH / 2), int(HEIGHT / 2), align="center")
         self.draw_text("Press 'ESC' to quit", self.title_font, 40, WHITE,
                        int(WIDTH / 2), int((HEIGHT / 2) + 60), align="center")
+        self.draw_text(f"Score: {self.score}", self.title_font, 30, WHITE,
+                       int(WIDTH / 2), int((HEIGHT / 2) + 160), align="center")
+        self.draw_text(f"High Score: {self.stats.high_score()}",
+                       self.title_font, 30, YELLOW, int(WIDTH / 2),
+                       int((HEIGHT / 2) + 200), align="center")
 
         pygame.display.flip()
         self.wait_for_key()
@@ -245,6 +296,10 @@ class Game:
     
     def quit(self):
         """Function to quit game."""
+        # finish the session if quitting mid-game
+        if self.stats.session_id is not None:
+            self.stats.end_session(self.score, self.player.hops)
+        self.stats.close()
         pygame.quit()
         sys.exit()
 
@@ -7,6 +7,7 @@ DARKGREY = (40, 40, 40)
 LIGHTGREY = (100, 100, 100)
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
+DARKGREEN = (0, 100, 0)
 BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 BROWN = (106, 55, 5)
@@ -21,6 +22,14 @@ BGCOLOR = BLACK
 
 SPRITESHEET = "graphics-game-sprites.png"
 
+# stats settings
+STATS_DB = "frogger.db"
+STATS_BATCH_SIZE = 50
+STATS_FLUSH_INTERVAL = 2
+STATS_BUFFER_LIMIT = 5000
+STATS_MAX_RETRIES = 5
+HOME_SCORE = 50
+
 TILESIZE = 60
 GRIDWIDTH = WIDTH / TILESIZE
 GRIDHEIGHT = HEIGHT / TILESIZE
@@ -68,4 +77,35 @@ PLATFORMS_PER_LANE = {
     3.5: 2,
     4.5: 1,
     5.5: 3,
-}
\ No newline at end of file
+}
+
+# alligator settings (alligators replace some of the platforms in the lane)
+ALLIGATOR_LANES = [2.5]
+ALLIGATORS_PER_LANE = {
+    2.5: 1,
+}
+ALLIGATOR_SIZE = (186, 40)
+ALLIGATOR_HEAD = 50
+
+# hazard settings - phases are (name, duration in ms, rideable, deadly)
+DIVE_PHASES = [
+    ('surfaced', 4000, True, False),
+    ('sinking', 400, True, False),
+    ('diving', 400, True, False),
+    ('submerged', 1200, False, False),
+    ('rising', 400, True, False),
+]
+JAW_PHASES = [
+    ('closed', 2500, True, False),
+    ('open', 1200, True, True),
+]
+# turtle images for the dive phases (no image: swim, not rideable: hidden)
+DIVE_IMGS = {
+    'sinking': "images/turtles_sink1.png",
+    'diving': "images/turtles_sink2.png",
+    'rising': "images/turtles_sink2.png",
+}
+# water lane 3 is the turtle lane
+HAZARD_PHASES = {WATER_LANES[2]: DIVE_PHASES}
+for lane in ALLIGATOR_LANES:
+    HAZARD_PHASES[lane] = JAW_PHASES
\ No newline at end of file
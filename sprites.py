@@ -53,6 +53,9 @@ class Player(pygame.sprite.Sprite):
         # life counter
         self.lives = 3
 
+        # hop counter
+        self.hops = 0
+
     def load_images(self):
         """Function to load all of froggers images."""
         self.down_frames = [pygame.transform.scale(
@@ -80,6 +83,7 @@ class Player(pygame.sprite.Sprite):
 
     def move(self, direction):
         """Move Frogger one tile down."""
+        self.hops += 1
         if direction == 'down':
             self.y += TILESIZE
             self.facing = 'down'
@@ -248,21 +252,15 @@ class Platform(pygame.sprite.Sprite):
         self.current_frame = 0
         self.last_update = 0
         
+        # set direction based on lane
+        self.dir = LANE_DIRS[self.lane]
+
         # set the image of the platform
         self.load_images()
-        # water lane 3 will be turtle lane later
-        if self.lane == WATER_LANES[2]:
-            self.image = self.turtle_frames[0]
-        elif self.lane == WATER_LANES[0] or self.lane == WATER_LANES[3]:
-            self.image = self.log_imgs['sm']
-        elif self.lane == WATER_LANES[1]:
-            self.image = self.log_imgs['md']
+        self.image = self.start_image()
         self.image.set_colorkey(BLACK)
         self.rect = self.image.get_rect()
         
-        # set direction based on lane
-        self.dir = LANE_DIRS[self.lane]
-        
         # Set start position based on direction
         if self.dir == 1:
             # start left of screen
@@ -302,6 +300,27 @@ class Platform(pygame.sprite.Sprite):
                     pygame.image.load("images/turtles3.png"), (148, 47)),
                     True, False),
             ]
+        # turtle imgs for each diving phase
+        self.dive_frames = {}
+        for phase, duration, rideable, deadly in DIVE_PHASES:
+            if not rideable:
+                self.dive_frames[phase] = pygame.Surface(
+                    (148, 40), pygame.SRCALPHA)
+            elif phase in DIVE_IMGS:
+                image = pygame.image.load(DIVE_IMGS[phase])
+                height = int(image.get_height() * 148 / image.get_width())
+                self.dive_frames[phase] = pygame.transform.flip(
+                    pygame.transform.scale(image, (148, height)), True, False)
+
+    def start_image(self):
+        """Starting image of the platform based on its lane."""
+        # water lane 3 is the turtle lane
+        if self.lane == WATER_LANES[2]:
+            return self.turtle_frames[0]
+        elif self.lane == WATER_LANES[0] or self.lane == WATER_LANES[3]:
+            return self.log_imgs['sm']
+        elif self.lane == WATER_LANES[1]:
+            return self.log_imgs['md']
     
     def animate(self):
         """Animate turtle images."""
@@ -317,11 +336,20 @@ class Platform(pygame.sprite.Sprite):
             self.image = self.turtle_frames[self.current_frame]
             self.rect = self.image.get_rect()
 
+    def dive(self):
+        """Swim or dive turtles based on the phase of the lane."""
+        frame = self.dive_frames.get(self.game.hazards[self.lane].phase)
+        if frame is None:
+            self.animate()
+        elif self.image is not frame:
+            self.image = frame
+            self.rect = self.image.get_rect()
+
     def update(self):
         """Update log."""
         # animate turtles
         if self.lane == WATER_LANES[2]:
-            self.animate()
+            self.dive()
 
         # if platform exits the screen, return it to original position
         if self.dir == 1 and self.rect.left > WIDTH:
@@ -332,4 +360,70 @@ class Platform(pygame.sprite.Sprite):
         # move the platform by adding speed to its positions
         self.x += self.speed
         self.rect.x = self.x
-        self.rect.centery = self.lane * TILESIZE
\ No newline at end of file
+        self.rect.centery = self.lane * TILESIZE
+
+
+
+class Alligator(Platform):
+    """Class to manage alligators (ride the body, avoid the open jaws)."""
+
+    def __init__(self, game, lane):
+        """Initialize alligator attributes."""
+        Platform.__init__(self, game, lane)
+        self.add(game.alligators)
+
+    def load_images(self):
+        """Draw the alligator for each jaw phase (open when deadly)."""
+        self.jaw_imgs = {}
+        width, height = ALLIGATOR_SIZE
+        neck = width - ALLIGATOR_HEAD
+        for jaw, duration, rideable, deadly in JAW_PHASES:
+            image = pygame.Surface(ALLIGATOR_SIZE)
+            # tail, legs and body
+            pygame.draw.polygon(image, DARKGREEN, [
+                (0, height / 2), (neck / 4, height / 4),
+                (neck / 4, height * 3 / 4)])
+            for x in (neck / 4, neck * 3 / 4):
+                pygame.draw.rect(image, DARKGREEN, (x, 0, 10, height))
+            pygame.draw.ellipse(image, DARKGREEN,
+                                (neck / 8, height / 5, neck, height * 3 / 5))
+            # head
+            if not deadly:
+                pygame.draw.polygon(image, DARKGREEN, [
+                    (neck, height / 4), (width, height * 2 / 5),
+                    (width, height * 3 / 5), (neck, height * 3 / 4)])
+            else:
+                pygame.draw.polygon(image, DARKGREEN, [
+                    (neck, height / 4), (width, 0),
+                    (width, height / 8), (neck + 10, height / 2)])
+                pygame.draw.polygon(image, DARKGREEN, [
+                    (neck + 10, height / 2), (width, height * 7 / 8),
+                    (width, height), (neck, height * 3 / 4)])
+                pygame.draw.polygon(image, RED, [
+                    (neck + 10, height / 2), (width, height / 8),
+                    (width, height * 7 / 8)])
+            pygame.draw.circle(image, YELLOW, (int(neck + 8), int(height / 3)), 3)
+
+            # flip if moving left
+            if self.dir == -1:
+                image = pygame.transform.flip(image, True, False)
+            image.set_colorkey(BLACK)
+            self.jaw_imgs[jaw] = image
+
+    def start_image(self):
+        """Alligator starts in the first jaw phase."""
+        return self.jaw_imgs[JAW_PHASES[0][0]]
+
+    def head_rect(self):
+        """Rect of the head (the deadly end when the jaws are open)."""
+        head = self.rect.copy()
+        head.width = ALLIGATOR_HEAD
+        if self.dir == 1:
+            head.right = self.rect.right
+        return head
+
+    def update(self):
+        """Update alligator."""
+        # open or close jaws based on the phase of the lane
+        self.image = self.jaw_imgs[self.game.hazards[self.lane].phase]
+        Platform.update(self)
@@ -0,0 +1,219 @@
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+
+from settings import *
+
+log = logging.getLogger(__name__)
+
+
+class StatsStore:
+    """Class to persist high scores and session stats in a SQLite database.
+
+    Events are buffered in memory and written in batches on a background
+    thread so the game loop never waits on the disk. Stats are optional, so
+    database errors are logged and never stop the game.
+    """
+
+    def __init__(self, filename):
+        """Open the database, create the tables, and start the writer."""
+        self.conn = None
+        try:
+            self.conn = sqlite3.connect(filename, check_same_thread=False)
+            self.create_tables()
+        except sqlite3.Error as e:
+            # unwritable folder, corrupt or locked file: keep stats in memory
+            log.warning("Can't open stats database %s (%s), stats will not "
+                        "be saved", filename, e)
+            if self.conn is not None:
+                self.conn.close()
+            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self.create_tables()
+
+        # pending (sql, params) writes and the locks that guard them
+        self.buffer = []
+        self.dropped = 0
+        self.retries = 0
+        self.buffer_lock = threading.Lock()
+        self.db_lock = threading.Lock()
+
+        # current session and best score (kept in memory for the screens)
+        self.session_id = None
+        self.best = self.query_value(
+            "SELECT MAX(score) FROM sessions WHERE ended IS NOT NULL")
+
+        # background writer thread
+        self.running = True
+        self.wake = threading.Event()
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def create_tables(self):
+        """Create the session and event tables and their indexes."""
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "id TEXT PRIMARY KEY, started REAL, ended REAL, "
+                "score INTEGER DEFAULT 0, hops INTEGER DEFAULT 0)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "session_id TEXT, kind TEXT, cause TEXT, value REAL, "
+                "time REAL)")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_score "
+                "ON sessions (score DESC)")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_kind "
+                "ON events (kind, cause)")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_session "
+                "ON events (session_id, kind)")
+
+    def queue(self, sql, params, droppable=False):
+        """Add a write to the buffer, waking the writer if it is full."""
+        with self.buffer_lock:
+            # drop new events (never sessions) if the database can't keep up
+            if droppable and len(self.buffer) >= STATS_BUFFER_LIMIT:
+                self.dropped += 1
+                return
+            self.buffer.append((sql, params))
+            full = len(self.buffer) >= STATS_BATCH_SIZE
+        if full:
+            self.wake.set()
+
+    def start_session(self):
+        """Begin a new session and return its id."""
+        self.session_id = uuid.uuid4().hex
+        self.queue("INSERT INTO sessions (id, started) VALUES (?, ?)",
+                   (self.session_id, time.time()))
+        return self.session_id
+
+    def end_session(self, score, hops):
+        """Record the final score and hop count of the current session."""
+        if self.session_id is None:
+            return
+        self.queue("UPDATE sessions SET ended = ?, score = ?, hops = ? "
+                   "WHERE id = ?",
+                   (time.time(), score, hops, self.session_id))
+        self.session_id = None
+        self.best = max(self.best, score)
+
+    def log_event(self, kind, cause=None, value=None):
+        """Record an event (death, home) for the current session."""
+        self.queue("INSERT INTO events (session_id, kind, cause, value, time) "
+                   "VALUES (?, ?, ?, ?, ?)",
+                   (self.session_id, kind, cause, value, time.time()),
+                   droppable=True)
+
+    def write_batch(self):
+        """Write everything in the buffer in a single transaction.
+
+        Returns False if the write failed. Batches that fail because the
+        database is busy or full are put back to be retried (up to
+        STATS_MAX_RETRIES times), any other failed batch is dropped.
+        """
+        # hold the db lock across the swap so batches are written in order
+        with self.db_lock:
+            with self.buffer_lock:
+                batch, self.buffer = self.buffer, []
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                log.warning("Stats buffer full, dropped %d events", dropped)
+            if not batch:
+                return True
+            try:
+                with self.conn:
+                    for sql, params in batch:
+                        self.conn.execute(sql, params)
+            except sqlite3.Error as e:
+                retry = (isinstance(e, sqlite3.OperationalError)
+                         and self.retries < STATS_MAX_RETRIES)
+                if retry:
+                    self.retries += 1
+                    log.warning("Can't write stats (%s), retrying %d writes "
+                                "later", e, len(batch))
+                    with self.buffer_lock:
+                        self.buffer[:0] = batch
+                else:
+                    self.retries = 0
+                    log.error("Can't write stats (%s), dropped %d writes",
+                              e, len(batch))
+                return False
+            self.retries = 0
+            return True
+
+    def write_loop(self):
+        """Writer thread - flush the buffer when full or on an interval."""
+        while self.running:
+            self.wake.wait(STATS_FLUSH_INTERVAL)
+            self.wake.clear()
+            self.write_batch()
+
+    def flush(self):
+        """Write the buffer now (use outside the game loop)."""
+        return self.write_batch()
+
+    def close(self):
+        """Stop the writer, flush what is left, and close the database."""
+        self.running = False
+        self.wake.set()
+        self.writer.join()
+        self.write_batch()
+        self.conn.close()
+
+## QUERIES ##
+    def query(self, sql, params=()):
+        """Flush pending writes and run a read query ([] on error)."""
+        self.flush()
+        try:
+            with self.db_lock:
+                return self.conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            log.warning("Can't read stats (%s)", e)
+            return []
+
+    def query_value(self, sql, params=(), default=0):
+        """Run a query that returns a single value."""
+        rows = self.query(sql, params)
+        if not rows or rows[0][0] is None:
+            return default
+        return rows[0][0]
+
+    def high_scores(self, limit=10):
+        """Top finished sessions as (score, hops, ended) rows."""
+        return self.query(
+            "SELECT score, hops, ended FROM sessions "
+            "WHERE ended IS NOT NULL ORDER BY score DESC LIMIT ?", (limit,))
+
+    def high_score(self):
+        """Best score recorded so far (0 if none), without touching the disk."""
+        return self.best
+
+    def deaths_by_cause(self, session_id=None):
+        """Dict of death counts by cause (car, water, bush, alligator)."""
+        sql = "SELECT cause, COUNT(*) FROM events WHERE kind = 'death'"
+        params = ()
+        if session_id is not None:
+            sql += " AND session_id = ?"
+            params = (session_id,)
+        return dict(self.query(sql + " GROUP BY cause", params))
+
+    def average_home_time(self, session_id=None):
+        """Average seconds it took to reach a home."""
+        sql = "SELECT AVG(value) FROM events WHERE kind = 'home'"
+        params = ()
+        if session_id is not None:
+            sql += " AND session_id = ?"
+            params = (session_id,)
+        return self.query_value(sql, params)
+
+    def total_hops(self, session_id=None):
+        """Total number of hops taken in finished sessions."""
+        sql = "SELECT SUM(hops) FROM sessions WHERE ended IS NOT NULL"
+        params = ()
+        if session_id is not None:
+            sql += " AND id = ?"
+            params = (session_id,)
+        return self.query_value(sql, params)